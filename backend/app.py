@@ -1,10 +1,13 @@
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 import os
+import threading
 
 from .scraper import QuoteScraper
 from .preprocess import QuoteAnalyzer
 from .search import QuoteSearch
+from .responses import (CachedResponse, ResponseCache, dataset_version, json_body,
+                        make_etag, not_modified)
 
 app = Flask(__name__)
 CORS(app)  # This will allow all origins in development
@@ -12,6 +15,33 @@ CORS(app)  # This will allow all origins in development
 # Configure the data directory
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 os.makedirs(DATA_DIR, exist_ok=True)
+QUOTES_FILE = os.path.join(DATA_DIR, 'quotes.pkl')
+
+# Serialized + compressed read responses, keyed by dataset version and query
+response_cache = ResponseCache()
+# Searcher (and its lazily built indexes) for the current dataset version
+_searcher = {'version': None, 'instance': None}
+_searcher_lock = threading.Lock()
+
+def get_searcher(version):
+    """Reuse the QuoteSearch instance until the dataset changes"""
+    with _searcher_lock:
+        if _searcher['version'] != version or _searcher['instance'] is None:
+            _searcher['instance'] = QuoteSearch(data_dir=DATA_DIR)
+            _searcher['version'] = version
+        return _searcher['instance']
+
+SEARCH_TYPES = ('keyword', 'author', 'tag', 'semantic', 'fulltext')
+
+def normalize_search_key(search_type, query, exact_match, limit):
+    """Cache/ETag key for a search: equivalent requests map to the same key"""
+    # only exact author/tag matching is case-sensitive, and only they use `exact`
+    if search_type in ('author', 'tag') and exact_match:
+        return (search_type, query, True, limit)
+    # tokenizing searches ignore whitespace; substring searches treat it as part of the query
+    if search_type in ('semantic', 'fulltext'):
+        query = ' '.join(query.split())
+    return (search_type, query.lower(), False, limit)
 
 @app.route('/')
 def index():
@@ -40,6 +70,16 @@ def scrape_quotes():
 def get_stats():
     """Endpoint to get quote statistics"""
     try:
+        version = dataset_version(QUOTES_FILE)
+        cache_key = (version, 'stats')
+        etag = make_etag(version, 'stats')
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response()
+
         analyzer = QuoteAnalyzer(data_dir=DATA_DIR)
         df = analyzer.load_data()
         if df is None:
@@ -51,7 +91,7 @@ def get_stats():
         top_tags = analyzer.visualize_tag_distribution(top_n=10)
         top_authors = df['author'].value_counts().head(10).to_dict()
 
-        return jsonify({
+        body = json_body({
             'success': True,
             'stats': {
                 'total_quotes': len(df),
@@ -61,6 +101,8 @@ def get_stats():
                 'top_authors': top_authors
             }
         })
+        entry = CachedResponse(body, etag, precompress=True)
+        return response_cache.put(cache_key, entry).to_response()
     except Exception as e:
         return jsonify({
             'success': False,
@@ -72,6 +114,8 @@ def search_quotes():
     """Endpoint to search quotes"""
     try:
         search_type = request.args.get('type', 'keyword')
+        if search_type not in SEARCH_TYPES:
+            search_type = 'keyword'  # unknown types fall back to keyword search
         query = request.args.get('query', '')
         exact_match = request.args.get('exact', 'false').lower() == 'true'
         limit = int(request.args.get('limit', 10))
@@ -82,7 +126,18 @@ def search_quotes():
                 'message': 'Query parameter is required'
             }), 400
 
-        searcher = QuoteSearch(data_dir=DATA_DIR)
+        version = dataset_version(QUOTES_FILE)
+        request_key = ('search',) + normalize_search_key(search_type, query, exact_match, limit)
+        cache_key = (version,) + request_key
+        etag = make_etag(version, request_key)
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response()
+
+        searcher = get_searcher(version)
         
         if search_type == 'author':
             results = searcher.search_by_author(query, exact_match=exact_match)
@@ -93,20 +148,23 @@ def search_quotes():
             # Add similarity scores to results
             results = results.copy()
             results['similarity'] = similarities
+        elif search_type == 'fulltext':
+            results, scores = searcher.fulltext_search(query, top_n=limit)
+            # Add BM25 relevance scores to results
+            if hasattr(results, 'head'):
+                results = results.copy()
+                results['score'] = scores
         else:  # keyword search
             results = searcher.search_by_keyword(query)
 
-        # Convert results to list of dicts and limit the number of results
-        if hasattr(results, 'to_dict'):
-            quotes = results.head(limit).to_dict(orient='records')
+        # Limit the number of results and let pandas encode the records
+        if hasattr(results, 'head'):
+            quotes = results.head(limit)
+            body = json_body({'success': True, 'total': len(quotes)}, records=quotes)
         else:
-            quotes = []
+            body = json_body({'success': True, 'results': [], 'total': 0})
 
-        return jsonify({
-            'success': True,
-            'results': quotes,
-            'total': len(quotes)
-        })
+        return response_cache.put(cache_key, CachedResponse(body, etag)).to_response()
     except Exception as e:
         return jsonify({
             'success': False,
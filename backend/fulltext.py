@@ -0,0 +1,240 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+
+class FullTextIndex:
+    """BM25 full-text index over the quotes, with prefix and fuzzy matching"""
+
+    def __init__(self, analyzer, k1=1.5, b=0.75, author_weight=2.0, tag_weight=1.5,
+                 max_expansions=10):
+        self.analyzer = analyzer
+        self.k1 = k1
+        self.b = b
+        self.author_weight = author_weight
+        self.tag_weight = tag_weight
+        self.max_expansions = max_expansions
+
+        self.num_docs = 0
+        self.doc_lengths = []
+        self.avg_doc_length = 0.0
+        # term -> (sorted doc ids, term frequencies, precomputed BM25 scores)
+        self.postings = {}
+        self.idf = {}
+        self.max_scores = {}
+        # sorted term dictionary for prefix lookups
+        self.terms = []
+        # author / tag word -> sorted doc ids
+        self.author_postings = {}
+        self.tag_postings = {}
+
+    def build(self, df):
+        """Build the index from a quotes dataframe"""
+        self.num_docs = len(df)
+        self.doc_lengths = []
+        term_docs = {}
+        author_docs = {}
+        tag_docs = {}
+
+        for doc_id, (text, author, tags) in enumerate(zip(df['text'], df['author'], df['tags'])):
+            tokens = self.analyzer.preprocess_text(text).split()
+            self.doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                term_docs.setdefault(term, []).append((doc_id, tf))
+
+            for word in set(self._words(author)):
+                author_docs.setdefault(word, []).append(doc_id)
+            for word in set(w for tag in tags for w in self._words(tag)):
+                tag_docs.setdefault(word, []).append(doc_id)
+
+        self.avg_doc_length = (sum(self.doc_lengths) / self.num_docs) if self.num_docs else 0.0
+
+        # precompute BM25 scores per posting so queries only sum them up
+        self.postings = {}
+        self.idf = {}
+        self.max_scores = {}
+        for term, entries in term_docs.items():
+            idf = self._idf(len(entries))
+            doc_ids = [doc_id for doc_id, _ in entries]
+            tfs = [tf for _, tf in entries]
+            scores = [self._bm25(idf, tf, self.doc_lengths[doc_id]) for doc_id, tf in entries]
+            self.postings[term] = (doc_ids, tfs, scores)
+            self.idf[term] = idf
+            self.max_scores[term] = max(scores)
+
+        self.terms = sorted(self.postings)
+        self.author_postings = author_docs
+        self.tag_postings = tag_docs
+
+        print(f"Built full-text index: {len(self.terms)} terms over {self.num_docs} quotes")
+        return self
+
+    def prefix_terms(self, prefix):
+        """Return indexed terms starting with the given prefix"""
+        matches = []
+        i = bisect_left(self.terms, prefix)
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            matches.append(self.terms[i])
+            i += 1
+        # keep the most informative expansions when the prefix is short
+        if len(matches) > self.max_expansions:
+            matches = sorted(matches, key=lambda t: -self.max_scores[t])[:self.max_expansions]
+        return matches
+
+    def fuzzy_terms(self, word, vocabulary):
+        """Return (term, distance) pairs from vocabulary within the edit budget of word"""
+        max_edits = self._max_edits(word)
+        matches = []
+        for term in vocabulary:
+            if abs(len(term) - len(word)) > max_edits:
+                continue
+            distance = bounded_edit_distance(word, term, max_edits)
+            if distance is not None:
+                matches.append((term, distance))
+        return matches
+
+    def search(self, query_text, top_n=10):
+        """Return the top_n (doc_id, score) pairs for the query, best first"""
+        clauses = self._query_clauses(query_text)
+        if not clauses or top_n <= 0:
+            return []
+        return self._top_k(clauses, top_n)
+
+    def _query_clauses(self, query_text):
+        """Turn a query into scored posting lists: (doc ids, scores, upper bound)"""
+        clauses = {}
+
+        # text field: exact terms, falling back to prefix expansion
+        for token in set(self.analyzer.preprocess_text(query_text).split()):
+            expansions = [token] if token in self.postings else self.prefix_terms(token)
+            for term in expansions:
+                doc_ids, _, scores = self.postings[term]
+                clauses[('text', term)] = (doc_ids, scores, self.max_scores[term])
+
+        # author and tag fields: typo-tolerant matching on raw query words, with the
+        # same stop-word and length filtering preprocess_text applies to the text field
+        words = set(
+            word for word in self._words(query_text)
+            if word not in self.analyzer.stop_words and len(word) > 2
+        )
+        for field, postings, weight in (('author', self.author_postings, self.author_weight),
+                                        ('tag', self.tag_postings, self.tag_weight)):
+            for word in words:
+                for term, distance in self.fuzzy_terms(word, postings):
+                    doc_ids = postings[term]
+                    score = weight * self._idf(len(doc_ids)) * (1.0 - distance / (len(term) + 1))
+                    key = (field, term)
+                    if key not in clauses or clauses[key][2] < score:
+                        clauses[key] = (doc_ids, [score] * len(doc_ids), score)
+
+        return list(clauses.values())
+
+    def _top_k(self, clauses, k):
+        """MaxScore top-k retrieval: skip documents that cannot enter the heap"""
+        # order clauses by their upper bound so the cheap tail can be pruned
+        clauses = sorted(clauses, key=lambda c: c[2])
+        bounds = [c[2] for c in clauses]
+        cumulative = []
+        total = 0.0
+        for bound in bounds:
+            total += bound
+            cumulative.append(total)
+
+        heap = []
+        threshold = 0.0
+        # clauses before `first_essential` can't lift a doc past the threshold alone
+        first_essential = 0
+        cursors = [0] * len(clauses)
+
+        while True:
+            # next candidate is the smallest doc id among the essential lists
+            candidate = None
+            for i in range(first_essential, len(clauses)):
+                doc_ids = clauses[i][0]
+                if cursors[i] < len(doc_ids):
+                    doc_id = doc_ids[cursors[i]]
+                    if candidate is None or doc_id < candidate:
+                        candidate = doc_id
+            if candidate is None:
+                break
+
+            score = 0.0
+            for i in range(first_essential, len(clauses)):
+                doc_ids, scores, _ = clauses[i]
+                if cursors[i] < len(doc_ids) and doc_ids[cursors[i]] == candidate:
+                    score += scores[cursors[i]]
+                    cursors[i] += 1
+
+            # probe non-essential lists, highest bound first, while the doc can still qualify
+            for i in range(first_essential - 1, -1, -1):
+                if score + cumulative[i] <= threshold:
+                    break
+                doc_ids, scores, _ = clauses[i]
+                pos = bisect_left(doc_ids, candidate, cursors[i])
+                cursors[i] = pos
+                if pos < len(doc_ids) and doc_ids[pos] == candidate:
+                    score += scores[pos]
+
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -candidate))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, -candidate))
+            else:
+                continue
+
+            if len(heap) == k:
+                threshold = heap[0][0]
+                while first_essential < len(clauses) and cumulative[first_essential] <= threshold:
+                    first_essential += 1
+                if first_essential == len(clauses):
+                    # no remaining document can beat the current top-k
+                    break
+
+        return [(-neg_id, score) for score, neg_id in sorted(heap, reverse=True)]
+
+    def _idf(self, doc_freq):
+        """BM25 inverse document frequency (always positive)"""
+        return math.log(1 + (self.num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def _bm25(self, idf, tf, doc_length):
+        """BM25 score of a single term occurrence count in a document"""
+        norm = 1 - self.b + self.b * (doc_length / self.avg_doc_length if self.avg_doc_length else 0)
+        return idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+    @staticmethod
+    def _words(text):
+        """Lowercase alphabetic words of a name, tag or raw query"""
+        return re.findall(r'[a-z]+', text.lower())
+
+    @staticmethod
+    def _max_edits(word):
+        """Edit distance allowed for a word, scaled with its length"""
+        if len(word) <= 3:
+            return 0
+        if len(word) <= 6:
+            return 1
+        return 2
+
+def bounded_edit_distance(a, b, max_edits):
+    """Levenshtein distance between a and b, or None if it exceeds max_edits"""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_edits:
+        return None
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            current[j] = min(previous[j] + 1,
+                             current[j - 1] + 1,
+                             previous[j - 1] + (ca != cb))
+            row_min = min(row_min, current[j])
+        # every path through this row already costs more than allowed
+        if row_min > max_edits:
+            return None
+        previous = current
+
+    return previous[-1] if previous[-1] <= max_edits else None
@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+def dataset_version(quotes_file):
+    """Version string for the quotes data, changes whenever the file is rewritten"""
+    try:
+        stat = os.stat(quotes_file)
+    except FileNotFoundError:
+        return 'missing'
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+def make_etag(version, key):
+    """Opaque ETag value derived from the dataset version and the request key"""
+    return hashlib.sha1(f"{version}|{key!r}".encode('utf-8')).hexdigest()
+
+def _default(obj):
+    """Fallback for numpy scalars/arrays that the json module can't encode"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_body(payload, records=None):
+    """Encode payload as compact JSON bytes
+
+    When given, `records` (a dataframe) is encoded by pandas' C encoder and
+    added to the payload under 'results', skipping to_dict(orient='records').
+    """
+    body = json.dumps(payload, separators=(',', ':'), default=_default)
+    if records is not None:
+        results = records.to_json(orient='records')
+        body = body[:-1] + (',' if payload else '') + '"results":' + results + '}'
+    return body.encode('utf-8')
+
+class CachedResponse:
+    """A serialized JSON body plus its compressed variants
+
+    With `precompress`, every supported encoding is built up front (for
+    repeat payloads like stats). Otherwise each variant is compressed on
+    first request for the encoding the client negotiated, at a cheaper
+    brotli quality, so one-off searches don't pay for unused encodings.
+    """
+
+    def __init__(self, body, etag, precompress=False):
+        self.etag = etag
+        self.brotli_quality = 11 if precompress else 5
+        self.bodies = {'identity': body}
+        if precompress:
+            for encoding in self.encodings():
+                self.compressed(encoding)
+
+    @staticmethod
+    def encodings():
+        """Content encodings this server can produce, most preferred first"""
+        return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    def compressed(self, encoding):
+        """Body for the given encoding, compressing and memoizing it if needed"""
+        body = self.bodies.get(encoding)
+        if body is None:
+            raw = self.bodies['identity']
+            if encoding == 'br':
+                body = brotli.compress(raw, quality=self.brotli_quality)
+            else:
+                body = gzip.compress(raw, compresslevel=6)
+            self.bodies[encoding] = body
+        return body
+
+    def to_response(self):
+        """Build a response using the best encoding the client accepts"""
+        encoding = request.accept_encodings.best_match(self.encodings(), default='identity')
+        response = Response(self.compressed(encoding), mimetype='application/json')
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        return with_cache_headers(response, self.etag)
+
+class ResponseCache:
+    """Small LRU cache of CachedResponse objects keyed by (version, request key)"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        # request threads share the cache, so reordering/eviction must be atomic
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return entry
+
+def with_cache_headers(response, etag):
+    """Attach the validator headers shared by full and 304 responses"""
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds this ETag, else None"""
+    if request.if_none_match.contains_weak(etag):
+        return with_cache_headers(Response(status=304), etag)
+    return None
@@ -1,7 +1,9 @@
 import os
 import pandas as pd
 import re
+import threading
 from .preprocess import QuoteAnalyzer
+from .fulltext import FullTextIndex
 
 class QuoteSearch:
     def __init__(self, data_dir='data', quotes_file='quotes.pkl'):
@@ -9,6 +11,10 @@ class QuoteSearch:
         self.quotes_file = os.path.join(data_dir, quotes_file)
         self.df = None
         self.analyzer = None
+        self.fulltext_analyzer = None
+        self.fulltext_index = None
+        # guards lazy model/index setup when the instance is shared across threads
+        self._lock = threading.Lock()
         self.load_data()
         
     def load_data(self):
@@ -62,20 +68,43 @@ class QuoteSearch:
     
     def semantic_search(self, query_text, top_n=5):
         """Search quotes semantically similar to the query using LSI"""
-        if self.analyzer is None:
-            self.analyzer = QuoteAnalyzer(self.data_dir, os.path.basename(self.quotes_file))
-            self.analyzer.load_data()
-            self.analyzer.prepare_data_for_lsi()
-            self.analyzer.build_lsi_model()
+        with self._lock:
+            if self.analyzer is None:
+                analyzer = QuoteAnalyzer(self.data_dir, os.path.basename(self.quotes_file))
+                analyzer.load_data()
+                analyzer.prepare_data_for_lsi()
+                analyzer.build_lsi_model()
+                # only publish the analyzer once the model is fully built
+                self.analyzer = analyzer
             
         similar_quotes, similarities = self.analyzer.find_similar_quotes(query_text, top_n=top_n)
         return similar_quotes, similarities
+
+    def fulltext_search(self, query_text, top_n=10):
+        """Ranked BM25 search over quote text, with prefix matching and typo-tolerant author/tag matching"""
+        if self.df is None:
+            return [], []
+
+        with self._lock:
+            if self.fulltext_index is None:
+                # separate from self.analyzer, which semantic_search sets up with the LSI model
+                self.fulltext_analyzer = QuoteAnalyzer(self.data_dir, os.path.basename(self.quotes_file))
+                self.fulltext_index = FullTextIndex(self.fulltext_analyzer).build(self.df)
+
+        hits = self.fulltext_index.search(query_text, top_n=top_n)
+        doc_ids = [doc_id for doc_id, _ in hits]
+        scores = [score for _, score in hits]
+        return self.df.iloc[doc_ids], scores
         
 def print_results(results, limit=None):
     """Print the search results in a readable format"""
     if isinstance(results, tuple) and len(results) == 2:
-        # case: semantic search, returns quotes and similarity scores
+        # case: semantic / full-text search, returns quotes and scores
         quotes, similarities = results
+        if len(quotes) == 0:
+            print("No matching quotes found.")
+            return
+            
         for i, (_, quote) in enumerate(quotes.iterrows()):
             if limit is not None and i >= limit:
                 break
@@ -116,9 +145,10 @@ def interactive_search():
         print("2. Search by Tag")
         print("3. Search by Keyword")
         print("4. Semantic Search (Find Similar Quotes)")
-        print("5. Exit")
+        print("5. Full-Text Search (Ranked, Typo-Tolerant)")
+        print("6. Exit")
         
-        choice = input("\nEnter your choice (1-5): ")
+        choice = input("\nEnter your choice (1-6): ")
         
         if choice == '1':
             author = input("Enter author name: ")
@@ -144,6 +174,12 @@ def interactive_search():
             print_results(results)
             
         elif choice == '5':
+            query = input("Enter your query: ")
+            top_n = int(input("Number of results to return: ") or "10")
+            results = searcher.fulltext_search(query, top_n=top_n)
+            print_results(results)
+            
+        elif choice == '6':
             print("Goodbye!")
             break
             
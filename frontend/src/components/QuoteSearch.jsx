@@ -106,7 +106,8 @@ const SearchTypeIcon = memo(({ type }) => {
     keyword: Search,
     author: User,
     tag: Tag,
-    semantic: Brain
+    semantic: Brain,
+    fulltext: Sparkles
   };
   const Icon = icons[type] || Search;
   return <Icon className="w-5 h-5 text-primary" />;
@@ -157,14 +158,16 @@ export default function QuoteSearch() {
     keyword: 'Keyword Search',
     author: 'Author Search',
     tag: 'Tag Search',
-    semantic: 'Semantic Search'
+    semantic: 'Semantic Search',
+    fulltext: 'Full-Text Search'
   };
 
   const searchTypeDescriptions = {
     keyword: 'Find quotes containing specific words or phrases',
     author: 'Search by quote author name',
     tag: 'Find quotes with specific tags or categories',
-    semantic: 'LSI-powered search that understands meaning and context'
+    semantic: 'LSI-powered search that understands meaning and context',
+    fulltext: 'BM25-ranked search with prefix matching and typo-tolerant authors and tags'
   };
 
   return (